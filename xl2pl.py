@@ -6,28 +6,526 @@
 
 """
 import re
-import csv
-from io import StringIO, BytesIO, BufferedReader
+from io import BytesIO, BufferedReader
+from operator import itemgetter, length_hint
 from pathlib import Path
-from contextlib import closing
-from typing import Union, Optional, Literal, Callable, Sequence, IO, cast
+from contextlib import closing, nullcontext
+from functools import lru_cache
+from datetime import date, datetime, time
+from typing import (
+    Union,
+    Optional,
+    Literal,
+    Callable,
+    Sequence,
+    Iterator,
+    Generator,
+    Dict,
+    List,
+    Tuple,
+    Type,
+    Any,
+    IO,
+    ContextManager,
+)
+
+__dependencies__ = (
+    "polars pyarrow openpyxl fastexcel python_calamine xlsxwriter".split()
+)
+
+import polars as pl
+import polars.selectors as cs
+
+__all__ = ["load_excel", "save_excel"]
+
+# Префикс имён столбцов с пустым заголовком (как в fastexcel).
+_UNNAMED = "__UNNAMED__"
+
+# Дата, с которой calamine возвращает ячейки, содержащие только время суток.
+_EXCEL_TIME_DATE = date(1899, 12, 31)
+
+# Типы fastexcel для типов Polars, задаваемых при чтении листа (кроме числовых).
+_FASTEXCEL_DTYPES = {
+    pl.Utf8: "string",
+    pl.Boolean: "boolean",
+    pl.Date: "date",
+    pl.Datetime: "datetime",
+    pl.Duration: "duration",
+}
+_TEMPORAL = ("date", "datetime", "duration")
+
+# Имя столбца, которое fastexcel мог получить, делая заголовки уникальными (`A_1`).
+_DEDUPED = re.compile(r"(.*)_\d+")
+
+
+def _clean_headers(headers: Sequence) -> list:
+    """
+    Приводит заголовки столбцов к строкам, схлопывая пробельные символы
+    в один пробел и обрезая их по краям.
+    """
+    return (
+        pl.Series(list(headers), dtype=pl.Utf8, strict=False)
+        .str.replace_all(r"\s+", " ")
+        .str.strip_chars()
+        .to_list()
+    )
 
-__dependencies__ = "polars numpy tqdm openpyxl".split()
 
-for x in __dependencies__:
+def _header_names(head: Sequence) -> list:
+    """
+    Возвращает строковые заголовки столбцов по значениям ячеек строки заголовка.
+    Пустые ячейки получают имя `__UNNAMED__<индекс>`, целые числа записываются без `.0`,
+    дата без времени - как дата, время суток (с датой 1899-12-31) - как время.
+    """
+    names = []
+    for i, cell in enumerate(head):
+        if cell is None or cell == "":
+            names.append(f"{_UNNAMED}{i}")
+        elif cell.__class__ is float and cell.is_integer():
+            names.append(str(int(cell)))
+        elif isinstance(cell, datetime) and cell.date() == _EXCEL_TIME_DATE:
+            names.append(str(cell.time()))
+        elif isinstance(cell, datetime) and cell.time() == time(0):
+            names.append(str(cell.date()))
+        else:
+            names.append(str(cell))
+    return names
+
+
+def _take_column(test_cols: Optional[Callable[[str], Any]], name: str) -> bool:
+    """
+    Проверяет, выбран ли столбец с заголовком `name` условием `take_cols`
+    (`None` - все столбцы). Столбцы с пустым заголовком условием не выбираются.
+    """
+    if test_cols is None:
+        return True
+    return not name.startswith(_UNNAMED) and bool(test_cols(name))
+
+
+def _dedupe_headers(headers: Sequence[str]) -> list:
+    """
+    Делает заголовки уникальными так же, как fastexcel: повторы получают
+    суффикс `_1`, `_2`, ... (`A, A, C` -> `A, A_1, C`).
+    """
+    used: set = set()
+    counts: Dict[str, int] = {}
+    result = []
+    for name in headers:
+        unique = name
+        if name in used:
+            k = counts.get(name, 1)
+            while f"{name}_{k}" in used:
+                k += 1
+            counts[name] = k + 1
+            unique = f"{name}_{k}"
+        used.add(unique)
+        result.append(unique)
+    return result
+
+
+def _to_series(name: str, values: list) -> pl.Series:
+    """
+    Строит столбец датафрейма из значений ячеек.
+    Тип определяется Polars; при несовместимых значениях (например, даты вперемешку
+    с текстом) столбец становится строковым.
+    """
     try:
-        print(f'{x:_<14}: {__import__(x, fromlist=["__version__"])}')
-    except (ImportError, ModuleNotFoundError, AttributeError):
-        raise RuntimeError(f"Для работы программы необходим модуль: {x}")
+        return pl.Series(name, values, strict=False)
+    except (TypeError, pl.exceptions.PolarsError):
+        return pl.Series(name, values, dtype=pl.Utf8, strict=False)
 
 
-import polars as pl
-import openpyxl as oxl
+def _apply_dtypes(
+    df: pl.DataFrame, dtypes: Optional[Dict[str, Union[pl.DataType, Type[pl.DataType]]]]
+) -> pl.DataFrame:
+    """
+    Приводит столбцы датафрейма к типам `dtypes`. Столбцы, которых нет в датафрейме,
+    пропускаются; значение, не приводимое к заданному типу, - ошибка.
+    """
+    if not dtypes:
+        return df
+    try:
+        return df.cast({name: dtypes[name] for name in df.columns if name in dtypes})
+    except pl.exceptions.PolarsError as e:
+        raise ValueError(
+            f"Не удалось привести столбцы датафрейма к типам `dtypes`: {dtypes}."
+        ) from e
+
+
+def _make_picker(idxs: Sequence[int]) -> Callable[[Sequence], tuple]:
+    """
+    Возвращает функцию, выбирающую из строки значения по индексам `idxs`.
+    В отличие от `itemgetter`, всегда возвращает кортеж.
+    """
+    if not idxs:
+        return lambda row: ()
+    if len(idxs) == 1:
+        getter = itemgetter(*idxs)
+        return lambda row: (getter(row),)
+    return itemgetter(*idxs)
+
+
+@lru_cache(maxsize=64)
+def _compile_body(
+    i_col: int, n_cols: int, presized: bool = False, empty: Optional[str] = None
+) -> Callable[[Iterator, Callable, list], None]:
+    """
+    Генерирует функцию чтения тела таблицы, специализированную под число столбцов.
+
+    Значения строки распаковываются в локальные переменные и добавляются
+    в столбцы через заранее связанные методы `list.append`, без внутреннего цикла
+    по столбцам. Чтение прекращается на первой пустой ячейке в столбце `i_col`
+    (`None`, либо значение `empty`, которым пустые ячейки возвращает движок чтения).
+
+    При `presized=True` столбцы должны быть заранее заполнены `None` на число
+    оставшихся строк: значения записываются по индексу, лишний хвост удаляется.
+    """
+    names = [f"v{k}" for k in range(n_cols)]
+    appends = [f"a{k}" for k in range(n_cols)]
+    columns = [f"c{k}" for k in range(n_cols)]
+    lines = ["def body(rows, picker, cols):"]
+    if presized:
+        if n_cols:
+            lines.append(f"    {', '.join(columns)}, = cols")
+        lines.append("    i = 0")
+    elif n_cols:
+        lines.append(f"    {', '.join(appends)}, = [col.append for col in cols]")
+    lines += [
+        "    for row in rows:",
+        f"        if row[{i_col}] {'is None' if empty is None else f'== {empty!r}'}:",
+        "            break",
+    ]
+    if n_cols:
+        lines.append(f"        {', '.join(names)}, = picker(row)")
+        if presized:
+            lines += [f"        {c}[i] = {v}" for c, v in zip(columns, names)]
+        else:
+            lines += [f"        {a}({v})" for a, v in zip(appends, names)]
+    if presized:
+        lines += [
+            "        i += 1",
+            "    for col in cols:",
+            "        del col[i:]",
+        ]
+    ns: dict = {}
+    exec("\n".join(lines), ns)
+    return ns["body"]
+
+
+def _fastexcel_dtype(dtype: Union[pl.DataType, Type[pl.DataType]]) -> Optional[str]:
+    """
+    Возвращает тип fastexcel, соответствующий типу Polars, либо `None`,
+    если такой тип не задаётся при чтении листа.
+    """
+    if dtype.is_integer():
+        return "int"
+    if dtype.is_float():
+        return "float"
+    return _FASTEXCEL_DTYPES.get(dtype.base_type())
 
-__all__ = ["load_excel", "save_excel"]
 
+def _refine_dtypes(df: pl.DataFrame, skip: Optional[set] = None) -> pl.DataFrame:
+    """
+    Приводит типы столбцов к одинаковым для всех движков чтения (кроме столбцов `skip`):
+    - числа без дробной части в пределах int64 -> Int64 (calamine читает числа как float);
+    - время суток (calamine возвращает его с датой 1899-12-31) -> Time;
+    - даты и дата со временем -> Datetime("us"), как при чтении через openpyxl.
+    """
+    checks: List[Tuple[pl.Expr, pl.Expr, Optional[pl.Expr]]] = []
+    casts = []
+    for name, dtype in df.schema.items():
+        if skip and name in skip:
+            continue
+        col = pl.col(name)
+        if dtype == pl.Float64:
+            in_range = col.is_between(-(2.0**63), 2.0**63, closed="left")
+            checks.append(((col.floor() == col) & in_range, col.cast(pl.Int64), None))
+        elif dtype == pl.Datetime:
+            to_us = None if dtype == pl.Datetime("us") else col.cast(pl.Datetime("us"))
+            checks.append((col.dt.date() == _EXCEL_TIME_DATE, col.dt.time(), to_us))
+        elif dtype == pl.Date:
+            casts.append(col.cast(pl.Datetime("us")))
+
+    if checks:
+        passed = df.select(
+            check.all().alias(str(i)) for i, (check, _, _) in enumerate(checks)
+        ).row(0)
+        for ok, (_, then, otherwise) in zip(passed, checks):
+            cast = then if ok else otherwise
+            if cast is not None:
+                casts.append(cast)
+    return df.with_columns(casts) if casts else df
+
+
+def _read_calamine(
+    source: Union[Path, BufferedReader, BytesIO],
+    sheet: Union[int, str],
+    test_cols: Optional[Callable[[str], Any]],
+    *,
+    skip_rows: Optional[int] = None,
+    skip_foot: Optional[int] = None,
+    dtypes: Optional[Dict[str, Union[pl.DataType, Type[pl.DataType]]]] = None,
+) -> pl.DataFrame:
+    """
+    Загружает лист Excel через fastexcel (calamine), без построчного обхода в Python.
 
-re_w = re.compile(r"\s+")
+    Заголовки и отбор столбцов по `test_cols` - как при построчном чтении. Первый столбец
+    (столбец A) читается всегда: по его первой пустой ячейке определяется конец таблицы.
+    Типы столбцов определяются по всем строкам таблицы, типы `dtypes` задаются при чтении.
+    """
+    import fastexcel
+
+    if isinstance(sheet, int):
+        if sheet < 0:
+            raise ValueError(
+                f"Лист с индексом `{sheet}` отсутствует в файле Excel `{source}`."
+            )
+    elif not isinstance(sheet, str):
+        raise ValueError("sheet")
+
+    # fastexcel принимает только путь или `bytes`: file-like объект копируется в память.
+    try:
+        reader = fastexcel.read_excel(
+            str(source) if isinstance(source, Path) else source.read()
+        )
+    except Exception as e:
+        raise RuntimeError("Не удалось открыть файл Excel!") from e
+
+    def read(**options: Any) -> Any:
+        try:
+            # Явный `skip_rows=0`: иначе при `header_row=0` fastexcel берёт заголовок
+            # из первой непустой строки листа, а не из первой строки.
+            return reader.load_sheet(
+                sheet,
+                **{
+                    "header_row": skip_rows or 0,
+                    "skip_rows": 0,
+                    "schema_sample_rows": None,
+                    **options,
+                },
+            )
+        except Exception as e:
+            raise ValueError(
+                f"Не удалось загрузить лист `{sheet}` из файла Excel `{source}`!."
+            ) from e
+
+    def to_polars(ws: Any) -> Tuple[pl.DataFrame, list]:
+        batch, errors = ws.to_arrow_with_errors()
+        return pl.DataFrame(batch), errors.errors if errors else []
+
+    ws = read()
+    df, errors = to_polars(ws)
+
+    # Как и при построчном чтении, первый столбец таблицы - столбец A листа.
+    columns = ws.selected_columns
+    if not columns or columns[0].absolute_index != 0:
+        return pl.DataFrame()
+
+    # Заголовки, которые fastexcel сгенерировал (пустые ячейки, логические значения, даты)
+    # или сделал уникальными, берутся из самой строки заголовка, как при построчном чтении.
+    names = [col.name for col in columns]
+    if any(col.column_name_from == "generated" for col in columns) or any(
+        m and m.group(1) in names for m in map(_DEDUPED.fullmatch, names)
+    ):
+        head = read(header_row=None, skip_rows=skip_rows or 0, n_rows=1).to_polars()
+        names = _header_names(head.row(0) if head.height else [None] * len(columns))
+
+    # Пустая ячейка заголовка в первом столбце означает, что таблицы нет.
+    if names[0].startswith(_UNNAMED):
+        return pl.DataFrame()
+
+    # Условие `take_cols` проверяется до того, как заголовки сделаны уникальными.
+    idxs = [
+        i for i, name in enumerate(names) if i == 0 or _take_column(test_cols, name)
+    ]
+    df = df.select(df.columns[i] for i in idxs)
+    selected = [columns[i] for i in idxs]
+    columns = selected if _take_column(test_cols, names[0]) else selected[1:]
+    headers = _dedupe_headers(_clean_headers([names[col.index] for col in columns]))
+
+    # Типы из `dtypes` задаются при чтении, а не приведением после него.
+    overrides, typed = {}, set()
+    for col, name in zip(columns, headers):
+        dtype = _fastexcel_dtype(dtypes[name]) if dtypes and name in dtypes else None
+        # Дата и время приводятся к строкам после чтения: fastexcel выводит время суток
+        # вместе с датой 1899-12-31.
+        if dtype is not None and dtype != col.dtype and col.dtype not in _TEMPORAL:
+            overrides[col.absolute_index] = dtype
+            typed.add(name)
+    forced = set(overrides)
+
+    # Таблица заканчивается на первой пустой ячейке первого столбца. Если под ней
+    # есть данные (итоги, примечания), лист перечитывается только до границы таблицы,
+    # чтобы эти строки не влияли на типы столбцов.
+    stop = df.select(pl.first().is_null().arg_true().first()).item()
+    footer = stop is not None and not all(
+        df.slice(stop).select(pl.all().is_null().all()).row(0)
+    )
+
+    # Значения, не подходящие под определённый fastexcel тип столбца (например, "n/a"
+    # в числовом столбце), заменяются им на null: такие столбцы читаются как строки.
+    absolute = {col.index: col.absolute_index for col in selected}
+
+    def lost(errors: list) -> set:
+        return {
+            absolute[index]
+            for row, index in (error.offset_position for error in errors)
+            if (stop is None or row < stop) and index in absolute
+        }
+
+    reread, strings = footer or bool(overrides), lost(errors) - forced
+    while reread or strings:
+        overrides.update(dict.fromkeys(strings, "string"))
+        df, errors = to_polars(
+            read(
+                use_columns=lambda col: col.index in absolute,
+                n_rows=stop,
+                dtypes=overrides or None,
+            )
+        )
+        if lost(errors) & forced:
+            raise ValueError(
+                f"Не удалось привести столбцы датафрейма к типам `dtypes`: {dtypes}."
+            )
+        reread, strings = False, lost(errors) - set(overrides)
+
+    if stop is not None:
+        df = df.head(stop)
+
+    if skip_foot:
+        if skip_foot >= df.height:
+            raise ValueError(
+                "Слишком большой параметр `skip_foot`: пропущены все строки датафрейма."
+            )
+        df = df.head(-skip_foot)
+
+    if len(columns) < df.width:
+        df = df.drop(df.columns[0])
+
+    df.columns = headers
+    return _apply_dtypes(_refine_dtypes(df, skip=typed), dtypes)
+
+
+def _iter_openpyxl(
+    source: Union[Path, BufferedReader, BytesIO],
+    sheet: Union[int, str],
+    skip_rows: Optional[int] = None,
+) -> Generator[Sequence, None, None]:
+    """
+    Построчно читает значения ячеек листа Excel через openpyxl.
+    """
+    import openpyxl as oxl
+
+    try:
+        book: oxl.Workbook = oxl.open(source, read_only=True, data_only=True)  # type: ignore
+    except Exception as e:
+        raise RuntimeError("Не удалось открыть файл Excel!") from e
+
+    with closing(book):  # type: ignore
+        try:
+            if isinstance(sheet, int):
+                if not 0 <= sheet < len(book.worksheets):
+                    raise ValueError(
+                        f"Лист с индексом `{sheet}` отсутствует в файле Excel `{source}` "
+                        f"(всего листов: {len(book.worksheets)})."
+                    )
+                _sheet = book.worksheets[sheet]
+            elif isinstance(sheet, str):
+                _sheet = book[sheet]
+            else:
+                raise ValueError("sheet")
+        except ValueError:
+            raise
+        except Exception as e:
+            raise ValueError(
+                f"Не удалось загрузить лист `{sheet}` из файла Excel `{source}`!."
+            ) from e
+
+        if _sheet.max_row is None or _sheet.max_column is None:
+            # Лист без сохранённых размеров: без них строки не выравниваются по ширине.
+            _sheet.calculate_dimension(force=True)
+
+        yield from _sheet.iter_rows(
+            min_row=(skip_rows or 0) + 1,
+            max_row=_sheet.max_row,
+            max_col=_sheet.max_column,
+            values_only=True,
+        )
+
+
+def _calamine_rows(
+    source: Union[Path, BufferedReader, BytesIO],
+    sheet: Union[int, str],
+    skip_rows: Optional[int] = None,
+) -> list:
+    """
+    Читает значения ячеек листа Excel через python-calamine в список строк.
+
+    Лист разбирается целиком на стороне Rust; значения возвращаются как есть:
+    пустые ячейки - `""`, все числа - `float` (см. `_calamine_value`).
+    """
+    import python_calamine as pc
+
+    try:
+        if isinstance(source, Path):
+            book = pc.CalamineWorkbook.from_path(str(source))
+        else:
+            book = pc.CalamineWorkbook.from_filelike(source)
+    except Exception as e:
+        raise RuntimeError("Не удалось открыть файл Excel!") from e
+
+    with closing(book):
+        try:
+            if isinstance(sheet, int):
+                if not 0 <= sheet < len(book.sheet_names):
+                    raise ValueError(
+                        f"Лист с индексом `{sheet}` отсутствует в файле Excel `{source}` "
+                        f"(всего листов: {len(book.sheet_names)})."
+                    )
+                _sheet = book.get_sheet_by_index(sheet)
+            elif isinstance(sheet, str):
+                _sheet = book.get_sheet_by_name(sheet)
+            else:
+                raise ValueError("sheet")
+        except ValueError:
+            raise
+        except Exception as e:
+            raise ValueError(
+                f"Не удалось загрузить лист `{sheet}` из файла Excel `{source}`!."
+            ) from e
+
+        # `skip_empty_area=False`: индексы строк и столбцов совпадают с листом Excel.
+        data = _sheet.to_python(skip_empty_area=False)
+
+    del data[: skip_rows or 0]
+    return data
+
+
+def _calamine_value(value: Any) -> Any:
+    """
+    Приводит значение ячейки python-calamine к значению, как при чтении через openpyxl:
+    пустая ячейка (`""`) -> `None`, целое число в пределах int64 -> `int`.
+    """
+    if value == "":
+        return None
+    if value.__class__ is float and value.is_integer() and -(2**63) <= value < 2**63:
+        return int(value)
+    return value
+
+
+def _calamine_series(name: str, values: list) -> pl.Series:
+    """
+    Строит столбец датафрейма из значений ячеек python-calamine.
+    Значения приводятся как в `_calamine_value`, но по столбцу целиком, а не по ячейкам
+    (целые числа - в `_refine_dtypes`).
+    """
+    if "" in values:
+        values = [None if value == "" else value for value in values]
+    series = _to_series(name, values)
+    if series.dtype == pl.Utf8 and any(value.__class__ is float for value in values):
+        # Числа вперемешку с текстом: целые записываются без `.0`, как в openpyxl.
+        return _to_series(name, [_calamine_value(value) for value in values])
+    return series
 
 
 def load_excel(
@@ -38,36 +536,48 @@ def load_excel(
     skip_rows: Optional[int] = None,
     skip_foot: Optional[int] = None,
     take_cols: Optional[Union[Callable[[str], bool], Sequence[str], str]] = None,
+    dtypes: Optional[Dict[str, Union[pl.DataType, Type[pl.DataType]]]] = None,
+    engine: Literal["calamine", "openpyxl"] = "calamine",
 ) -> pl.DataFrame:
     """
     Загружает файл Excel в датафрейм Polars
 
     :param file: Путь к файлу Excel, либо file-like объект формата Excel.
+    File-like объект читается с начала: его позиция сбрасывается вызовом `seek(0)`.
     :param sheet: Индекс или имя листа, подлежащего чтению в датафрейм.
     :param zero_cell: Заголовок первого столбца должен соответствовать условию:
     ((str) -> bool; "&lt;regexp&gt;"; либо [&lt;column-list&gt;])
     :param skip_rows: Пропустить &lt;skip_rows&gt; строк сверху
     :param skip_foot: Пропустить &lt;skip_foot&gt; строк снизу
     :param take_cols: Выбрать столбцы, соответствующие условию:
-    ((str) -> bool; "&lt;regexp&gt;"; либо [&lt;column-list&gt;])
+    ((str) -> bool; "&lt;regexp&gt;"; либо [&lt;column-list&gt;]).
+    Условие проверяется по строковому заголовку; столбцы с пустым заголовком не выбираются.
+    :param dtypes: Типы столбцов {&lt;заголовок&gt;: &lt;тип polars&gt;}. Типы остальных
+    столбцов определяются автоматически.
+    :param engine: Движок чтения: `calamine` (по-умолчанию; fastexcel / python-calamine)
+    или `openpyxl` (построчное чтение, медленнее).
 
     :return: Датафрейм polars.DataFrame
     """
 
     # Проверка аргументов:
-    if isinstance(file, str):
-        path = Path(file)
+    source: Union[Path, BufferedReader, BytesIO]
+    if isinstance(file, (str, Path)):
+        path = source = Path(file)
     else:
         path = None
 
     if isinstance(file, (BufferedReader, BytesIO)):
-        path = "<file-like>"  # type: ignore
+        # File-like объект передаётся движкам чтения как есть и читается с начала
+        # (позиция в потоке вызывающего кода сбрасывается).
+        file.seek(0)
+        source = file
     elif not isinstance(path, Path):
         raise ValueError(
             "Аргумент `file` должен быть строкой либо объектом "
             f"pathlib.Path, io.BufferedReader или io.BytesIO. Не {type(file)}."
         )
-    elif path.suffix not in {"xlsx", "xls"}:
+    elif path.suffix.lower() not in (".xlsx", ".xls"):
         raise ValueError(
             "Аргумент `path` должен содержать путь к файлу Excel "
             f"и заканчиваться расширением `xlsx` или `xls`, не `{path.suffix or ''}`."
@@ -75,95 +585,102 @@ def load_excel(
     elif not path.exists():
         raise ValueError(f"Файл не найден: {path}")
 
-    if zero_cell is None:
-        test_cell = lambda cell: True
-    elif isinstance(zero_cell, str):
-        test_cell = lambda cell: cell.value in {zero_cell}
-    elif hasattr(zero_cell, "__iter__") and all(isinstance(x, str) for x in zero_cell):
-        test_cell = lambda cell: cell.value in set(zero_cell)
-    elif callable(zero_cell):
-        test_cell = lambda cell: zero_cell(cell.value)  # type: ignore
-    else:
-        raise ValueError("test_cell")
+    if engine not in {"calamine", "openpyxl"}:
+        raise ValueError(
+            f"Аргумент `engine` не может быть `{engine}`. "
+            "Возможные варианты: `calamine` или `openpyxl`."
+        )
 
+    test_cols: Optional[Callable[[str], Any]]
     if take_cols is None:
-        test_cols = lambda col: True
+        test_cols = None
     elif isinstance(take_cols, str):
-        test_cols = lambda col: bool(re.match(cast(str, take_cols), col))
+        test_cols = re.compile(take_cols).match
     elif hasattr(take_cols, "__iter__") and all(isinstance(x, str) for x in take_cols):
-        test_cols = lambda col: col in set(take_cols)
+        test_cols = frozenset(take_cols).__contains__
     elif callable(take_cols):
         test_cols = take_cols
     else:
         raise ValueError("take_cols")
 
-    buffer = StringIO()
-    writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
-
-    read_immediately = zero_cell is None
-    head_read = False
-    i_row, i_col = 0, 0
-    idxs = []
-
-    try:
-        book: oxl.Workbook = oxl.open(path, read_only=True, data_only=True)  # type: ignore
-    except Exception as e:
-        raise RuntimeError("Не удалось открыть файл Excel!") from e
-
-    rows = []
-
-    with closing(book):  # type: ignore
-        try:
-            if isinstance(sheet, int):
-                _sheet = book.worksheets[0]
-            elif isinstance(sheet, str):
-                _sheet = book[sheet]
-            else:
-                raise ValueError("sheet")
-        except ValueError:
-            raise
-        except Exception as e:
-            raise ValueError(
-                f"Не удалось загрузить лист `{sheet}` из файла Excel `{file}`!."
-            ) from e
-
-        for row in _sheet.iter_rows(min_row=(skip_rows or 0)):
-            i_row += 1
-            if not read_immediately:
-                for i, cell in enumerate(row):
-                    if test_cell(cell):
-                        i_col = i
-                        read_immediately = True
-                        break
-
-            if not read_immediately:
-                continue
-
-            if row[i_col].value is not None:
-                if not head_read:
-                    idxs = [
-                        i_col + i for i, cell in enumerate(row) if test_cols(cell.value)
-                    ]
-
-                data = [row[i].value for i in idxs]
+    if zero_cell is None and engine == "calamine":
+        return _read_calamine(
+            source,
+            sheet,
+            test_cols,
+            skip_rows=skip_rows,
+            skip_foot=skip_foot,
+            dtypes=dtypes,
+        )
 
-                if not head_read:
-                    data = [re_w.sub(" ", old).strip() for old in data]
-                    head_read = True
+    if zero_cell is None:
+        test_cell = lambda cell: True
+    elif isinstance(zero_cell, str):
+        test_cell = lambda cell: cell == zero_cell
+    elif hasattr(zero_cell, "__iter__") and all(isinstance(x, str) for x in zero_cell):
+        zero_set = frozenset(zero_cell)
+        test_cell = lambda cell: cell in zero_set
+    elif callable(zero_cell):
+        test_cell = lambda cell: zero_cell(cell)  # type: ignore
+    else:
+        raise ValueError("test_cell")
 
-                rows.append(data)
-            else:
+    headers = []
+    cols = []
+
+    rows: Iterator[Sequence]
+    ctx: ContextManager[Any]
+    if engine == "calamine":
+        # Значения calamine приводятся в Python только в строках до заголовка;
+        # значения тела таблицы - по столбцам, в `_calamine_series`.
+        rows = iter(_calamine_rows(source, sheet, skip_rows))
+        ctx = nullcontext()
+        fix_row: Optional[Callable[[Sequence], Sequence]] = lambda row: [
+            _calamine_value(cell) for cell in row
+        ]
+        empty, to_series = "", _calamine_series
+    else:
+        rows = _iter_openpyxl(source, sheet, skip_rows)
+        ctx = closing(rows)
+        fix_row, empty, to_series = None, None, _to_series
+
+    with ctx:
+        # 1. Поиск строки заголовка по `zero_cell`:
+        head, i_col = None, 0
+        for row in rows:
+            if fix_row is not None:
+                row = fix_row(row)
+            i_col = next((i for i, cell in enumerate(row) if test_cell(cell)), -1)
+            if i_col >= 0:
+                head = row
                 break
 
-    if skip_foot is not None and len(rows) < 2 and skip_foot > (len(rows) - 1):
-        raise ValueError(
-            "Слишком большой параметр `skip_foot`: пропущены все строки датафрейма."
-        )
-
-    writer.writerows(rows if skip_foot is None else rows[:skip_foot])
-    buffer.seek(0)
+        # 2. Чтение заголовка:
+        if head is not None and head[i_col] is not None:
+            names = _header_names(head)
+            idxs = [
+                i for i in range(i_col, len(head)) if _take_column(test_cols, names[i])
+            ]
+            picker = _make_picker(idxs)
+            headers = _dedupe_headers(_clean_headers(picker(names)))
+            # Если число оставшихся строк известно - столбцы выделяются сразу целиком.
+            n_left = length_hint(rows)
+            cols = [[None] * n_left for _ in idxs]
+
+            # 3. Чтение тела таблицы (до первой пустой ячейки в столбце `zero_cell`):
+            _compile_body(i_col, len(idxs), n_left > 0, empty)(rows, picker, cols)
+
+    n_rows = len(cols[0]) if cols else 0
+    if skip_foot:
+        if skip_foot >= n_rows:
+            raise ValueError(
+                "Слишком большой параметр `skip_foot`: пропущены все строки датафрейма."
+            )
+        for col in cols:
+            del col[-skip_foot:]
 
-    return pl.read_csv(buffer, dtypes=[pl.Utf8 for _ in idxs])
+    df = pl.DataFrame([to_series(name, col) for name, col in zip(headers, cols)])
+    return _apply_dtypes(_refine_dtypes(df), dtypes)
 
 
 def save_excel(
@@ -172,9 +689,13 @@ def save_excel(
     sheet_name: Optional[str] = None,
     *,
     if_sheet_exists: Literal["overwrite", "assert", "skip"] = "overwrite",
+    format: Literal["xlsx", "csv"] = "xlsx",
 ) -> pl.DataFrame:
     """
-    Сохраняет датафрейм Polars в файл Excel (используя openpyxl)
+    Сохраняет датафрейм Polars в файл Excel (новый файл - используя xlsxwriter,
+    добавление листа в существующий файл - используя openpyxl).
+    В новом файле данные записываются таблицей Excel без стиля и автофильтра,
+    числа - в формате `General`.
 
     :param path: Путь к файлу, в котороый нужно сохранить датафрейм, либо file-like объект с возможностью записи
     :param df: Датафрейм polars.DataFrame
@@ -183,6 +704,8 @@ def save_excel(
     `overwrite` - перезаписать (по-умолчанию);
     `assert` - выдать ошибку;
     `skip` - пропустить запись
+    :param format: Формат файла: `xlsx` (по-умолчанию) или `csv`.
+    В формате `csv` файл перезаписывается целиком, `sheet_name` и `if_sheet_exists` не используются.
     :return: Исходный датафрейм.
     """
     if isinstance(path, str):
@@ -191,21 +714,51 @@ def save_excel(
         raise ValueError(
             f"Аргумент `path` должен быть строкой или объектом pathlib.Path. Не {type(path)}."
         )
-    if path.suffix == ".xlsx":
+    if format not in {"xlsx", "csv"}:
+        raise ValueError(
+            f"Аргумент `format` не может быть `{format}`. "
+            "Возможные варианты: `xlsx` или `csv`."
+        )
+    if path.suffix.lower() != f".{format}":
         raise ValueError(
-            "Путь к файлу сохранения Excel должен заканчиваться "
-            f"расширением `.xlsx`, не `{path.suffix or ''}`!"
+            "Путь к файлу сохранения должен заканчиваться "
+            f"расширением `.{format}`, не `{path.suffix or ''}`!"
         )
 
+    if format == "csv":
+        try:
+            df.write_csv(path)
+        except Exception as e:
+            raise RuntimeError(
+                f"Не удалось сохранить файл {path}: ошибка доступа, или файл открыт в MS Excel!"
+            ) from e
+        return df
+
+    sheet_name = sheet_name or "Sheet"
+
     if not path.exists():
-        ctx = closing(oxl.workbook.Workbook(write_only=True))
-    else:
-        ctx = closing(oxl.open(path))  # type: ignore
+        # Новый файл записывается напрямую через xlsxwriter.
+        try:
+            # Без автофильтра и числовых форматов Polars: лист выглядит так же,
+            # как лист, добавленный в существующий файл через openpyxl.
+            df.write_excel(
+                path,
+                worksheet=sheet_name,
+                column_formats={~cs.temporal(): "General"},
+                autofilter=False,
+                autofit=False,
+            )
+        except Exception as e:
+            raise RuntimeError(
+                f"Не удалось сохранить файл {path}: ошибка доступа, или файл открыт в MS Excel!"
+            ) from e
+        return df
+
+    import openpyxl as oxl
 
     wb: oxl.Workbook
-    with ctx as wb:
+    with closing(oxl.open(path)) as wb:  # type: ignore
         sheets = wb.sheetnames[:]
-        sheet_name = sheet_name or "Sheet"
         if sheet_name in sheets:
             if (
                 not hasattr(if_sheet_exists, "__hash__")
@@ -228,12 +781,9 @@ def save_excel(
 
         sheet = wb.create_sheet(sheet_name)
 
-        head_wrot = False
-        for row in df.to_dicts():
-            if not head_wrot:
-                sheet.append(list(iter(row.keys())))
-                head_wrot = True
-            sheet.append(list(iter(row.values())))
+        sheet.append(df.columns)
+        for row in df.iter_rows():
+            sheet.append(row)
         try:
             wb.save(path)
         except Exception as e:
@@ -242,3 +792,11 @@ def save_excel(
             ) from e
 
     return df
+
+
+if __name__ == "__main__":
+    for x in __dependencies__:
+        try:
+            print(f'{x:_<16}: {__import__(x, fromlist=["__version__"])}')
+        except (ImportError, ModuleNotFoundError, AttributeError):
+            raise RuntimeError(f"Для работы программы необходим модуль: {x}")